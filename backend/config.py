@@ -7,6 +7,7 @@ class Settings(BaseSettings):
     CORS_ORIGINS: list = ["http://localhost:3000", "http://localhost:3001"]
     MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50MB
     MAX_FILES: int = 100
+    SALIENCY_PROXY_SIZE: int = 128  # max side of the downscaled image used for smart crop
 
     class Config:
         env_file = ".env"
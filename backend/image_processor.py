@@ -7,6 +7,7 @@ from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 
 from config import settings
@@ -26,7 +27,7 @@ from metrics import (
 class ImageProcessor:
     def __init__(self):
         self.tasks: Dict[str, Dict] = {}
-        self.file_info: Dict[str, Dict] = {}  # file_id -> {filename, path}
+        self.file_info: Dict[str, Dict] = {}  # file_id -> {filename, path, size, saliency}
         self.executor = ProcessPoolExecutor(max_workers=mp.cpu_count())
         os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
         os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
@@ -70,7 +71,9 @@ class ImageProcessor:
             height: int,
             mode: str,
             fill_color: Optional[str],
-            fill_colors: Optional[Dict[str, str]] = None
+            fill_colors: Optional[Dict[str, str]] = None,
+            smart_crop: bool = False,
+            focal_points: Optional[Dict[str, Tuple[float, float]]] = None
     ) -> str:
         """Start resize task and return task ID"""
         task_id = str(uuid.uuid4())
@@ -110,7 +113,8 @@ class ImageProcessor:
 
         # Start processing in background
         asyncio.create_task(self._process_images(
-            task_id, file_data, width, height, mode, fill_color, fill_colors
+            task_id, file_data, width, height, mode, fill_color, fill_colors,
+            smart_crop, focal_points
         ))
 
         return task_id
@@ -123,7 +127,9 @@ class ImageProcessor:
             height: int,
             mode: str,
             fill_color: Optional[str],
-            fill_colors: Optional[Dict[str, str]] = None
+            fill_colors: Optional[Dict[str, str]] = None,
+            smart_crop: bool = False,
+            focal_points: Optional[Dict[str, Tuple[float, float]]] = None
     ):
         """Process images using multiprocessing"""
         try:
@@ -135,6 +141,10 @@ class ImageProcessor:
             for i in range(0, len(file_data), batch_size):
                 batch = file_data[i:i + batch_size]
 
+                # Saliency is analysed once per upload and reused by every rendition
+                if mode == "fill" and smart_crop:
+                    await self._ensure_saliency(batch, focal_points)
+
                 # Create tasks for batch
                 task_data_list = []
                 for file_item in batch:
@@ -150,6 +160,15 @@ class ImageProcessor:
                         elif fill_color:
                             image_fill_color = fill_color
 
+                    # Determine crop focus for this image (client focal point wins)
+                    focal_point = None
+                    saliency = None
+                    if mode == "fill":
+                        if focal_points and file_id in focal_points:
+                            focal_point = focal_points[file_id]
+                        elif smart_crop:
+                            saliency = self.file_info.get(file_id, {}).get("saliency")
+
                     # Use the clean original filename - NEVER add UUID to output filename
                     # original_filename is already clean (stored without UUID prefix)
                     original_path = Path(original_filename)
@@ -168,7 +187,9 @@ class ImageProcessor:
                         width,
                         height,
                         mode,
-                        image_fill_color
+                        image_fill_color,
+                        focal_point,
+                        saliency
                     )
                     task_data_list.append({
                         "task": task,
@@ -214,6 +235,35 @@ class ImageProcessor:
         finally:
             active_tasks.dec()
 
+    async def _ensure_saliency(
+            self,
+            batch: List[Dict],
+            focal_points: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        """Compute and cache saliency profiles for files that don't have them yet"""
+        loop = asyncio.get_event_loop()
+        pending = [
+            file_item for file_item in batch
+            if not (focal_points and file_item["file_id"] in focal_points)
+            and "saliency" not in self.file_info.get(file_item["file_id"], {})
+        ]
+        if not pending:
+            return
+
+        results = await asyncio.gather(*[
+            loop.run_in_executor(
+                self.executor,
+                compute_saliency,
+                file_item["path"],
+                settings.SALIENCY_PROXY_SIZE
+            )
+            for file_item in pending
+        ])
+
+        for file_item, saliency in zip(pending, results):
+            if saliency is not None and file_item["file_id"] in self.file_info:
+                self.file_info[file_item["file_id"]]["saliency"] = saliency
+
     def get_progress(self, task_id: str) -> Optional[Dict]:
         """Get progress of resize task"""
         if task_id not in self.tasks:
@@ -261,7 +311,9 @@ def resize_image(
         width: int,
         height: int,
         mode: str,
-        fill_color: Optional[str]
+        fill_color: Optional[str],
+        focal_point: Optional[Tuple[float, float]] = None,
+        saliency: Optional[Dict[str, List[float]]] = None
 ) -> Optional[str]:
     """Resize single image (runs in separate process)"""
     start_time = time.time()
@@ -303,9 +355,16 @@ def resize_image(
 
                 canvas = Image.new("RGB", (width, height), color)
 
-                # Center and crop
-                x = (new_width - width) // 2
-                y = (new_height - height) // 2
+                # Crop around focal point / salient region, center otherwise
+                if focal_point:
+                    x = _focal_offset(focal_point[0], new_width, width)
+                    y = _focal_offset(focal_point[1], new_height, height)
+                elif saliency:
+                    x = _salient_offset(saliency["columns"], new_width, width)
+                    y = _salient_offset(saliency["rows"], new_height, height)
+                else:
+                    x = (new_width - width) // 2
+                    y = (new_height - height) // 2
                 cropped = resized.crop((x, y, x + width, y + height))
 
                 # Handle transparency
@@ -351,3 +410,59 @@ def extract_dominant_color(img: Image.Image) -> Tuple[int, int, int]:
         print(f"Error extracting color: {e}")
 
     return (255, 255, 255)
+
+
+def compute_saliency(input_path: str, proxy_size: int) -> Optional[Dict[str, List[float]]]:
+    """Compute column/row edge energy profiles on a downscaled proxy (runs in separate process)"""
+    try:
+        with Image.open(input_path) as img:
+            # Let the decoder downscale (JPEG) before the actual resize
+            img.draft("L", (proxy_size, proxy_size))
+            proxy = img.convert("L")
+            proxy.thumbnail((proxy_size, proxy_size), Image.Resampling.BILINEAR)
+
+        pixels = np.asarray(proxy, dtype=np.float32)
+        if pixels.ndim != 2 or min(pixels.shape) < 2:
+            return None
+
+        # Gradient magnitude as edge energy
+        energy = np.zeros_like(pixels)
+        energy[:, :-1] += np.abs(np.diff(pixels, axis=1))
+        energy[:-1, :] += np.abs(np.diff(pixels, axis=0))
+
+        return {
+            "columns": energy.sum(axis=0).tolist(),
+            "rows": energy.sum(axis=1).tolist()
+        }
+
+    except Exception as e:
+        print(f"Error computing saliency for {input_path}: {e}")
+        return None
+
+
+def _focal_offset(focus: float, full: int, window: int) -> int:
+    """Offset of a crop window centered on a fractional focus, clamped to the image"""
+    offset = int(round(focus * full - window / 2))
+    return max(0, min(offset, full - window))
+
+
+def _salient_offset(profile: List[float], full: int, window: int) -> int:
+    """Offset of the crop window holding the most energy along one axis"""
+    if window >= full or not profile:
+        return max(0, (full - window) // 2)
+
+    energy = np.asarray(profile, dtype=np.float64)
+    size = len(energy)
+    span = min(size, max(1, int(round(size * window / full))))
+
+    # Sliding window sums via cumulative sum
+    cumulative = np.concatenate(([0.0], np.cumsum(energy)))
+    scores = cumulative[span:] - cumulative[:-span]
+
+    # Prefer the most central window among (near-)equal candidates
+    candidates = np.flatnonzero(scores >= scores.max() * 0.98)
+    center = (size - span) / 2
+    start = candidates[np.argmin(np.abs(candidates - center))]
+
+    offset = int(round(start * full / size))
+    return max(0, min(offset, full - window))
@@ -95,7 +95,12 @@ async def resize_images(request: ResizeRequest):
         height=request.height,
         mode=request.mode,
         fill_color=request.fill_color,
-        fill_colors=request.fill_colors
+        fill_colors=request.fill_colors,
+        smart_crop=request.smart_crop,
+        focal_points={
+            file_id: (point.x, point.y)
+            for file_id, point in request.focal_points.items()
+        } if request.focal_points else None
     )
 
     return {"task_id": task_id}
@@ -3,6 +3,11 @@ from typing import List, Optional, Literal, Dict
 from pydantic import BaseModel, Field
 
 
+class FocalPoint(BaseModel):
+    x: float = Field(ge=0, le=1, description="Horizontal position as a fraction of image width")
+    y: float = Field(ge=0, le=1, description="Vertical position as a fraction of image height")
+
+
 class ResizeRequest(BaseModel):
     file_ids: List[str]
     width: int = Field(gt=0, le=10000)
@@ -11,6 +16,9 @@ class ResizeRequest(BaseModel):
     fill_color: Optional[str] = Field(None, pattern=r"^#[0-9A-Fa-f]{6}$")
     fill_colors: Optional[Dict[str, str]] = Field(None,
                                                   description="Per-image fill colors (file_id -> color)")
+    smart_crop: bool = Field(False, description="Pick the fill crop window from image saliency instead of centering")
+    focal_points: Optional[Dict[str, FocalPoint]] = Field(None,
+                                                          description="Per-image fill crop focal points (file_id -> point)")
 
 
 class ResizeResponse(BaseModel):
@@ -40,6 +40,8 @@ export async function resizeImages(
         mode: "stretch" | "fit" | "fill";
         fillColor?: string;
         fillColors?: Record<string, string>;
+        smartCrop?: boolean;
+        focalPoints?: Record<string, { x: number; y: number }>;
     }
 ): Promise<ResizeResponse> {
     const response = await api.post<ResizeResponse>(
@@ -51,6 +53,8 @@ export async function resizeImages(
             mode: params.mode,
             fill_color: params.fillColor,
             fill_colors: params.fillColors,
+            smart_crop: params.smartCrop,
+            focal_points: params.focalPoints,
         },
         {
             headers: {